@@ -18,11 +18,13 @@ def config_schema(self) -> Optional[IDefinitionConfigSchema]:
 
     @property
     def has_config_field(self) -> bool:
-        return self.config_schema is not None and bool(self.config_schema.as_field())
+        config_schema = self.config_schema
+        return config_schema is not None and bool(config_schema.as_field())
 
     @property
     def config_field(self) -> Optional[Field]:
-        return None if not self.config_schema else self.config_schema.as_field()
+        config_schema = self.config_schema
+        return None if not config_schema else config_schema.as_field()
 
     # getter for typed access
     def get_config_field(self) -> Field:
@@ -51,11 +53,10 @@ def apply_config_mapping(self, config: Any) -> EvaluateValueResult:
         # If schema is on a mapped schema this is the innermost resource (base case),
         # so we aren't responsible for validating against anything farther down.
         # Returns an EVR for type consistency with config_mapping_fn.
-        return (
-            self.config_schema.resolve_config(config)
-            if isinstance(self.config_schema, ConfiguredDefinitionConfigSchema)
-            else EvaluateValueResult.for_value(config)
-        )
+        config_schema = self.config_schema
+        if isinstance(config_schema, ConfiguredDefinitionConfigSchema):
+            return config_schema.resolve_config(config)
+        return EvaluateValueResult.for_value(config)
 
 
 class AnonymousConfigurableDefinition(ConfigurableDefinition):
@@ -151,20 +152,23 @@ def copy_for_configured(
 
 
 def _check_configurable_param(configurable: ConfigurableDefinition) -> Any:
-    from dagster.core.definitions.composition import PendingNodeInvocation
-
-    check.param_invariant(
-        not isinstance(configurable, PendingNodeInvocation),
-        "configurable",
-        (
-            "You have invoked `configured` on a PendingNodeInvocation (an intermediate type), which is "
-            "produced by aliasing or tagging a solid definition. To configure a solid, you must "
-            "call `configured` on either a SolidDefinition and CompositeSolidDefinition. To fix "
-            "this error, make sure to call `configured` on the definition object *before* using "
-            "the `tag` or `alias` methods. For usage examples, see "
-            "https://docs.dagster.io/overview/configuration#configured"
-        ),
-    )
+    # Only pay for the (circular-import-avoiding) local import on the error path, since a
+    # PendingNodeInvocation is never a ConfigurableDefinition.
+    if not isinstance(configurable, ConfigurableDefinition):
+        from dagster.core.definitions.composition import PendingNodeInvocation
+
+        check.param_invariant(
+            not isinstance(configurable, PendingNodeInvocation),
+            "configurable",
+            (
+                "You have invoked `configured` on a PendingNodeInvocation (an intermediate type), "
+                "which is produced by aliasing or tagging a solid definition. To configure a "
+                "solid, you must call `configured` on either a SolidDefinition and "
+                "CompositeSolidDefinition. To fix this error, make sure to call `configured` on "
+                "the definition object *before* using the `tag` or `alias` methods. For usage "
+                "examples, see https://docs.dagster.io/overview/configuration#configured"
+            ),
+        )
     check.inst_param(
         configurable,
         "configurable",
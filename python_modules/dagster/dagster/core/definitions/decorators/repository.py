@@ -16,8 +16,20 @@
 from ..schedule import ScheduleDefinition
 from ..sensor import SensorDefinition
 
+_TOP_LEVEL_RETURN_TYPES = (list, dict, RepositoryData)
+
+_ALLOWED_DEF_TYPES = (
+    PipelineDefinition,
+    PartitionSetDefinition,
+    ScheduleDefinition,
+    SensorDefinition,
+    GraphDefinition,
+)
+
 
 class _Repository:
+    __slots__ = ["name", "description"]
+
     def __init__(self, name: Optional[str] = None, description: Optional[str] = None):
         self.name = check.opt_str_param(name, "name")
         self.description = check.opt_str_param(description, "description")
@@ -30,11 +42,7 @@ def __call__(self, fn: Callable[[], Any]) -> RepositoryDefinition:
 
         repository_definitions = fn()
 
-        if not (
-            isinstance(repository_definitions, list)
-            or isinstance(repository_definitions, dict)
-            or isinstance(repository_definitions, RepositoryData)
-        ):
+        if not isinstance(repository_definitions, _TOP_LEVEL_RETURN_TYPES):
             raise DagsterInvalidDefinitionError(
                 "Bad return value of type {type_} from repository construction function: must "
                 "return list, dict, or RepositoryData. See the @repository decorator docstring for "
@@ -44,20 +52,11 @@ def __call__(self, fn: Callable[[], Any]) -> RepositoryDefinition:
         if isinstance(repository_definitions, list):
             bad_definitions = []
             for i, definition in enumerate(repository_definitions):
-                if not (
-                    isinstance(definition, PipelineDefinition)
-                    or isinstance(definition, PartitionSetDefinition)
-                    or isinstance(definition, ScheduleDefinition)
-                    or isinstance(definition, SensorDefinition)
-                    or isinstance(definition, GraphDefinition)
-                ):
+                if not isinstance(definition, _ALLOWED_DEF_TYPES):
                     bad_definitions.append((i, type(definition)))
             if bad_definitions:
                 bad_definitions_str = ", ".join(
-                    [
-                        "value of type {type_} at index {i}".format(type_=type_, i=i)
-                        for i, type_ in bad_definitions
-                    ]
+                    f"value of type {type_} at index {i}" for i, type_ in bad_definitions
                 )
                 raise DagsterInvalidDefinitionError(
                     "Bad return value from repository construction function: all elements of list "
@@ -67,19 +66,15 @@ def __call__(self, fn: Callable[[], Any]) -> RepositoryDefinition:
             repository_data = CachingRepositoryData.from_list(repository_definitions)
 
         elif isinstance(repository_definitions, dict):
-            if not set(repository_definitions.keys()).issubset(VALID_REPOSITORY_DATA_DICT_KEYS):
+            bad_keys = [
+                key for key in repository_definitions if key not in VALID_REPOSITORY_DATA_DICT_KEYS
+            ]
+            if bad_keys:
+                bad_keys_str = ", ".join(f"'{key}'" for key in bad_keys)
                 raise DagsterInvalidDefinitionError(
                     "Bad return value from repository construction function: dict must not contain "
-                    "keys other than {{'pipelines', 'partition_sets', 'schedules', 'jobs'}}: found "
-                    "{bad_keys}".format(
-                        bad_keys=", ".join(
-                            [
-                                "'{key}'".format(key=key)
-                                for key in repository_definitions.keys()
-                                if key not in VALID_REPOSITORY_DATA_DICT_KEYS
-                            ]
-                        )
-                    )
+                    "keys other than {'pipelines', 'partition_sets', 'schedules', 'jobs'}: found "
+                    f"{bad_keys_str}"
                 )
             repository_data = CachingRepositoryData.from_dict(repository_definitions)
         elif isinstance(repository_definitions, RepositoryData):
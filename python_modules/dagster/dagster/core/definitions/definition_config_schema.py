@@ -32,6 +32,8 @@ def convert_user_facing_definition_config_schema(
 # by the new schema) that will pass the parent definition's config schema.
 #
 class IDefinitionConfigSchema(ABC):
+    __slots__ = []
+
     @abstractmethod
     def as_field(self) -> Field:
         raise NotImplementedError()
@@ -70,6 +72,8 @@ def description(self) -> Optional[str]:
 
 
 class DefinitionConfigSchema(IDefinitionConfigSchema):
+    __slots__ = ["_config_field"]
+
     def __init__(self, config_field: Field):
         self._config_field = check.inst_param(config_field, "config_field", Field)
 
@@ -80,13 +84,22 @@ def as_field(self) -> Field:
 def _get_user_code_error_str_lambda(
     configured_definition: "ConfigurableDefinition",
 ) -> Callable[[], str]:
-    return lambda: (
+    error_str = (
         "The config mapping function on a `configured` {} has thrown an unexpected "
         "error during its execution."
     ).format(configured_definition.__class__.__name__)
+    return lambda: error_str
 
 
 class ConfiguredDefinitionConfigSchema(IDefinitionConfigSchema):
+    __slots__ = [
+        "parent_def",
+        "_current_field",
+        "_config_fn",
+        "_static_config",
+        "_user_code_error_str_lambda",
+    ]
+
     def __init__(self, parent_definition, config_schema, config_or_config_fn):
         from .configurable import ConfigurableDefinition
 
@@ -98,17 +111,27 @@ def __init__(self, parent_definition, config_schema, config_or_config_fn):
         self._current_field = config_schema.as_field() if config_schema else None
 
         if not callable(config_or_config_fn):
-            self._config_fn = lambda _: config_or_config_fn
+            # Static config involves no user code, so it is used directly rather than through a
+            # thunk. It is still validated at resolve time since it may contain values (e.g. env
+            # var sources) that must be resolved at run time.
+            self._config_fn = None
+            self._static_config = config_or_config_fn
+            self._user_code_error_str_lambda = None
         else:
             self._config_fn = config_or_config_fn
+            self._static_config = None
+            self._user_code_error_str_lambda = _get_user_code_error_str_lambda(self.parent_def)
 
     def as_field(self) -> Field:
         return self._current_field
 
     def _invoke_user_config_fn(self, processed_config: Dict[str, Any]) -> Dict[str, Any]:
+        if self._config_fn is None:
+            return {"config": self._static_config}
+
         with user_code_error_boundary(
             DagsterConfigMappingFunctionError,
-            _get_user_code_error_str_lambda(self.parent_def),
+            self._user_code_error_str_lambda,
         ):
             return {"config": self._config_fn(processed_config.get("config", {}))}
 
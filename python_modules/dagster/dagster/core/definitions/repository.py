@@ -12,13 +12,15 @@
 from .sensor import SensorDefinition
 from .utils import check_valid_name
 
-VALID_REPOSITORY_DATA_DICT_KEYS = {
-    "pipelines",
-    "partition_sets",
-    "schedules",
-    "sensors",
-    "jobs",
-}
+VALID_REPOSITORY_DATA_DICT_KEYS = frozenset(
+    {
+        "pipelines",
+        "partition_sets",
+        "schedules",
+        "sensors",
+        "jobs",
+    }
+)
 
 RepositoryLevelDefinition = TypeVar(
     "RepositoryLevelDefinition", PipelineDefinition, PartitionSetDefinition, ScheduleDefinition
@@ -429,21 +431,16 @@ def from_dict(repository_definitions):
             when constructing the definitions is costly.
         """
         check.dict_param(repository_definitions, "repository_definitions", key_type=str)
-        check.invariant(
-            set(repository_definitions.keys()).issubset(VALID_REPOSITORY_DATA_DICT_KEYS),
-            "Bad dict: must not contain keys other than {{{valid_keys}}}: found {bad_keys}.".format(
-                valid_keys=", ".join(
-                    ["'{key}'".format(key=key) for key in VALID_REPOSITORY_DATA_DICT_KEYS]
-                ),
-                bad_keys=", ".join(
-                    [
-                        "'{key}'"
-                        for key in repository_definitions.keys()
-                        if key not in VALID_REPOSITORY_DATA_DICT_KEYS
-                    ]
-                ),
-            ),
-        )
+        bad_keys = [
+            key for key in repository_definitions if key not in VALID_REPOSITORY_DATA_DICT_KEYS
+        ]
+        if bad_keys:
+            valid_keys_str = ", ".join(f"'{key}'" for key in VALID_REPOSITORY_DATA_DICT_KEYS)
+            bad_keys_str = ", ".join(f"'{key}'" for key in bad_keys)
+            check.failed(
+                f"Bad dict: must not contain keys other than {{{valid_keys_str}}}: found "
+                f"{bad_keys_str}."
+            )
 
         for key in VALID_REPOSITORY_DATA_DICT_KEYS:
             if key not in repository_definitions:
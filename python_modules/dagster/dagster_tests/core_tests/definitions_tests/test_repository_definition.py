@@ -20,11 +20,13 @@
     solid,
     weekly_schedule,
 )
+from dagster.check import CheckError
 from dagster.core.definitions.partition import (
     Partition,
     PartitionedConfig,
     StaticPartitionsDefinition,
 )
+from dagster.core.definitions.repository import CachingRepositoryData
 
 
 def create_single_node_pipeline(name, called):
@@ -153,6 +155,35 @@ def _some_repo():
             return ["not-a-pipeline"]
 
 
+def test_bad_repository_list_elements_message():
+    with pytest.raises(
+        DagsterInvalidDefinitionError,
+        match=(
+            "Got value of type <class 'int'> at index 0, value of type <class 'str'> at index 1."
+        ),
+    ):
+
+        @repository
+        def _some_repo():
+            return [1, "a"]
+
+
+def test_bad_repository_dict_keys():
+    with pytest.raises(
+        DagsterInvalidDefinitionError,
+        match="dict must not contain keys other than .*: found 'bogus', 'x'",
+    ):
+
+        @repository
+        def _some_repo():
+            return {"pipelines": {}, "bogus": {}, "x": {}}
+
+
+def test_bad_caching_repository_data_dict_keys():
+    with pytest.raises(CheckError, match="must not contain keys other than .*: found 'bogus'."):
+        CachingRepositoryData.from_dict({"pipelines": {}, "bogus": {}})
+
+
 def test_schedule_partitions():
     @daily_schedule(
         pipeline_name="foo",
@@ -1,4 +1,16 @@
-from dagster import ModeDefinition, execute_pipeline, pipeline, resource, solid
+import pytest
+from dagster import (
+    DagsterInvalidConfigError,
+    ModeDefinition,
+    StringSource,
+    configured,
+    execute_pipeline,
+    pipeline,
+    resource,
+    solid,
+)
+from dagster.check import ParameterCheckError
+from dagster.core.test_utils import environ
 
 
 def test_configured_solids_and_resources():
@@ -34,3 +46,66 @@ def mypipeline():
     result = execute_pipeline(mypipeline)
 
     assert result.success
+
+
+def _pipeline_with_resource(resource_def):
+    @solid(required_resource_keys={"res"})
+    def emit_res(context):
+        return context.resources.res
+
+    @pipeline(mode_defs=[ModeDefinition(resource_defs={"res": resource_def})])
+    def res_pipeline():
+        emit_res()
+
+    return res_pipeline
+
+
+def test_configured_static_config_resolves_env_at_run_time():
+    @resource(config_schema={"x": StringSource})
+    def x_resource(context):
+        return context.resource_config["x"]
+
+    configured_resource = x_resource.configured({"x": {"env": "FOO"}})
+    res_pipeline = _pipeline_with_resource(configured_resource)
+
+    with environ({"FOO": "bar"}):
+        result = execute_pipeline(res_pipeline)
+        assert result.success
+        assert result.result_for_solid("emit_res").output_value() == "bar"
+
+    with environ({"FOO": "baz"}):
+        result = execute_pipeline(res_pipeline)
+        assert result.result_for_solid("emit_res").output_value() == "baz"
+
+
+def test_configured_invalid_static_config_fails_at_resolve_time():
+    @resource(config_schema={"x": str})
+    def x_resource(context):
+        return context.resource_config["x"]
+
+    # no error at definition time
+    configured_resource = x_resource.configured({"y": 1})
+    res_pipeline = _pipeline_with_resource(configured_resource)
+
+    with pytest.raises(DagsterInvalidConfigError):
+        execute_pipeline(res_pipeline)
+
+
+def test_configured_pending_node_invocation_error():
+    @solid(config_schema={"x": int})
+    def my_solid(_):
+        pass
+
+    with pytest.raises(
+        ParameterCheckError,
+        match="You have invoked `configured` on a PendingNodeInvocation \\(an intermediate type\\)",
+    ):
+        configured(my_solid.alias("a"))
+
+
+def test_configured_non_definition_error():
+    with pytest.raises(
+        ParameterCheckError,
+        match="Only the following types can be used with the `configured` method",
+    ):
+        configured(5)